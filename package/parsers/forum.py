@@ -1,9 +1,20 @@
 import datetime
 import pathlib
-from typing import List
+from typing import Iterator, List
 from bs4 import BeautifulSoup
 
 
+class ForumMessage:
+    """A single message (the post itself or a reply) from a forum thread"""
+
+    def __init__(self, index:int, author:str, time:str, content:str, has_header:bool=True):
+        self.index = index  # position of the message in the thread, 0 is the post itself
+        self.author = author
+        self.has_header = has_header  # False if the username was hidden, e.g. consecutive messages
+        self.time = time
+        self.content = content
+
+
 class DiscordForumParser:
     """Extracts info from a discord forum thread"""
 
@@ -71,22 +82,49 @@ class DiscordForumParser:
             links.append(link.get('href'))
         return links
     
-    @property
-    def text(self) -> str:
-        """Returns all text found in the post"""
-        found_text = ''
+    def iter_messages(self, author_first:bool=False) -> Iterator[ForumMessage]:
+        """Lazily yields every message in the thread, optionally the author's own messages first"""
+        if not author_first:
+            yield from self._iter_messages()
+            return
+        post_author = self.author
+        for msg in self._iter_messages():
+            if msg.author == post_author:
+                yield msg
+        for msg in self._iter_messages():
+            if msg.author != post_author:
+                yield msg
+
+    def _iter_messages(self) -> Iterator[ForumMessage]:
         messages_wrapper = self.root_element.find('div', attrs={'class': 'messagesWrapper-RpOMA3'})
         messages_scroller_inner = messages_wrapper.find('ol', attrs={'data-list-id': 'chat-messages'})
         chat_messages_container = messages_scroller_inner.find_all('li', attrs={'class': 'messageListItem-ZZ7v6g'})
-        for msg in chat_messages_container:
+        # consecutive messages from the same user only show the username once
+        last_author = ''
+        for index, msg in enumerate(chat_messages_container):
             msg_author = msg.find('span', attrs={'class': 'username-h_Y3Us'})
             msg_time = msg.find('time')
             msg_content = msg.find('div', attrs={'class': 'markup-eYLPri messageContent-2t3eCI'})
             if msg_author:
-                found_text += f'\n[{msg_author.text}]\n'
-            found_text += msg_time.text + '\n'
-            found_text += msg_content.text + '\n'
-        return found_text
+                last_author = msg_author.text
+            yield ForumMessage(
+                index=index,
+                author=last_author,
+                time=msg_time.text if msg_time else '',
+                content=msg_content.text if msg_content else '',
+                has_header=msg_author is not None
+            )
+
+    @property
+    def text(self) -> str:
+        """Returns all text found in the post"""
+        lines = []
+        for msg in self.iter_messages():
+            if msg.has_header:
+                lines.append(f'\n[{msg.author}]')
+            lines.append(msg.time)
+            lines.append(msg.content)
+        return '\n'.join(lines) + '\n' if lines else ''
     
     def save_extracted_text(self):
         # Saves all extracted text from the page to a text file
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 
 from .forum import DiscordForumParser
 from ..utils.helpers import NumberConverter, InfoExtractor
@@ -98,10 +98,24 @@ class VoiceModel:
         return result
 
 
+class ReplyLink:
+    """A download link found in one of the thread messages"""
+
+    def __init__(self, url:str, message_index:int, author:str):
+        self.url = url
+        self.message_index = message_index
+        self.author = author
+
+    def __repr__(self) -> str:
+        return f'ReplyLink({self.url!r}, message_index={self.message_index}, author={self.author!r})'
+
+
 class VoiceModelParser:
 
     def __init__(self, forum_parser: DiscordForumParser):
         self.forum_parser = forum_parser
+        self.__reply_links = None  # cached result of the fallback search in the replies
+        self.__link_from_replies = False
 
     @property
     def title(self) -> str:
@@ -146,14 +160,46 @@ class VoiceModelParser:
         # Filter download links
         valid_download_providers = ['drive.google.com', 'mega.nz', 'mediafire', 'pixeldrain', 'krakenfiles']
         links_filtered = []
+        self.__link_from_replies = False
         for link in all_links:
             for valid_provider in valid_download_providers:
                 if valid_provider in link:
                     links_filtered.append(link)
         # if links not found in the post, look for it in the comments
         if len(links_filtered) < 1:
-            links_filtered = InfoExtractor.extract_links(self.forum_parser.text)
+            links_filtered = [reply_link.url for reply_link in self.reply_links]
+            self.__link_from_replies = len(links_filtered) > 0
         return links_filtered
+
+    @property
+    def reply_links(self) -> List[ReplyLink]:
+        """Download links found in the thread messages, used when the post has no valid link"""
+        if self.__reply_links is None:
+            self.__reply_links = self.find_reply_links()
+        return self.__reply_links
+
+    @property
+    def link_source(self) -> Optional[ReplyLink]:
+        """The message the download link came from, `None` if it came from the post or wasn't found"""
+        self.links  # records where the links came from
+        if not self.__link_from_replies:
+            return None
+        # the first link is the one used as download link
+        return self.reply_links[0]
+
+    def find_reply_links(self, stop_at_first:bool=True) -> List[ReplyLink]:
+        """Searches the thread messages one by one, the author's own messages first.
+        If `stop_at_first` is True, returns as soon as a message with links is found
+        (more than one link means it's ambiguous and needs to be checked manually),
+        otherwise collects the links from every message"""
+        found_links = []
+        for msg in self.forum_parser.iter_messages(author_first=True):
+            msg_links = InfoExtractor.extract_links(msg.content)
+            for link in msg_links:
+                found_links.append(ReplyLink(link, msg.index, msg.author))
+            if stop_at_first and found_links:
+                return found_links
+        return found_links
     
     def extract_model(self) -> VoiceModel:
         """Returns a `VoiceModel` object"""
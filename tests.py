@@ -1,6 +1,9 @@
 import unittest
 
-from package.parsers.voice_model import VoiceModel
+from bs4 import BeautifulSoup
+
+from package.parsers.forum import DiscordForumParser
+from package.parsers.voice_model import VoiceModel, VoiceModelParser
 from package.utils.helpers import NumberConverter, InfoExtractor
 
 
@@ -113,5 +116,97 @@ class TestVoiceModel(unittest.TestCase):
         self.assertEqual(str(self.voice3), 'Rosé (RVC v2) 1.2k Epochs 44.1k Steps')
 
 
+def build_thread_html(post_author, messages):
+    # minimal discord forum thread, messages are (author or None, time or None, content or None)
+    items = ''
+    for msg_author, msg_time, msg_content in messages:
+        item = '<li class="messageListItem-ZZ7v6g">'
+        if msg_author is not None:
+            item += f'<span class="username-h_Y3Us">{msg_author}</span>'
+        if msg_time is not None:
+            item += f'<time>{msg_time}</time>'
+        if msg_content is not None:
+            item += f'<div class="markup-eYLPri messageContent-2t3eCI">{msg_content}</div>'
+        items += item + '</li>'
+    html = (
+        '<section role="complementary"><div></div>'
+        '<div class="messagesWrapper-RpOMA3"><ol data-list-id="chat-messages">'
+        f'<li><div><div><h3><span><span>{post_author}</span></span></h3></div></div></li>'
+        '<div><h3>Title</h3></div>'
+        f'{items}</ol></div></section>'
+    )
+    return BeautifulSoup(html, 'html.parser')
+
+
+class TestDiscordForumParserMessages(unittest.TestCase):
+
+    def setUp(self):
+        html_data = build_thread_html('a', [
+            (None, 't0', 'no author'),
+            ('a', 't1', 'x'),
+            (None, 't2', 'y'),
+            ('b', 't3', 'z'),
+            ('a', 't4', 'w'),
+        ])
+        self.forum_parser = DiscordForumParser(html_data)
+
+    def test_iter_messages(self):
+        messages = [(m.index, m.author, m.has_header) for m in self.forum_parser.iter_messages()]
+        self.assertEqual(messages, [(0, '', False), (1, 'a', True), (2, 'a', False), (3, 'b', True), (4, 'a', True)])
+
+    def test_iter_messages_author_first(self):
+        messages = [(m.index, m.author) for m in self.forum_parser.iter_messages(author_first=True)]
+        self.assertEqual(messages, [(1, 'a'), (2, 'a'), (4, 'a'), (0, ''), (3, 'b')])
+
+    def test_missing_elements(self):
+        forum_parser = DiscordForumParser(build_thread_html('a', [('a', None, None)]))
+        msg = next(forum_parser.iter_messages())
+        self.assertEqual((msg.time, msg.content), ('', ''))
+
+    def test_text(self):
+        expected = 't0\nno author\n\n[a]\nt1\nx\nt2\ny\n\n[b]\nt3\nz\n\n[a]\nt4\nw\n'
+        self.assertEqual(self.forum_parser.text, expected)
+
+
+class TestVoiceModelParserReplyLinks(unittest.TestCase):
+
+    def setUp(self):
+        self.link1 = 'https://drive.google.com/file/d/1Rn7dOfD3BvZjUP36pAEv8VCYJC9clogS/view?usp=sharing'
+        self.link2 = 'https://mega.nz/file/1fUjzTYQ#wrCJhg-r0LpRdYQJfuqao_f7JN6phJFQjrTpNlY_aVo'
+        self.link3 = 'https://drive.google.com/file/d/2Rn7dOfD3BvZjUP36pAEv8VCYJC9clogS/view?usp=drive_link'
+        html_data = build_thread_html('user1', [
+            ('user1', 't0', 'New model'),
+            ('user2', 't1', f'Mirror: {self.link2}'),
+            ('user1', 't2', f'Here is the link {self.link1}'),
+        ])
+        self.parser = VoiceModelParser(DiscordForumParser(html_data))
+
+    def test_author_reply_first(self):
+        self.assertEqual(self.parser.links, [self.link1])
+        source = self.parser.link_source
+        self.assertEqual(source.message_index, 2)
+        self.assertEqual(source.author, 'user1')
+
+    def test_collect_all_links(self):
+        reply_links = self.parser.find_reply_links(stop_at_first=False)
+        self.assertEqual([link.url for link in reply_links], [self.link1, self.link2])
+        self.assertEqual([link.message_index for link in reply_links], [2, 1])
+
+    def test_ambiguous_author_reply(self):
+        # the author's reply has multiple links, a later single link from another user must not win
+        html_data = build_thread_html('user1', [
+            ('user1', 't0', f'v1 {self.link1} v2 {self.link3}'),
+            ('user2', 't1', f'other model {self.link3}'),
+        ])
+        parser = VoiceModelParser(DiscordForumParser(html_data))
+        self.assertEqual(parser.links, [self.link1, self.link3])
+        self.assertEqual(parser.link_source.author, 'user1')
+
+    def test_no_links(self):
+        parser = VoiceModelParser(DiscordForumParser(build_thread_html('user1', [('user1', 't0', 'New model')])))
+        self.assertEqual(parser.links, [])
+        self.assertIsNone(parser.link_source)
+
+
 if __name__ == '__main__':
     unittest.main()